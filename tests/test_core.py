@@ -1,6 +1,6 @@
 import pytest
 
-from the_floor_game.core import Category, Player, Game
+from the_floor_game.core import Category, Player, Duel, Game
 
 
 def test_board_and_positions_and_challenge():
@@ -15,8 +15,8 @@ def test_board_and_positions_and_challenge():
     game = Game(players=[p1, p2], nrows=1, ncols=2)
 
     # positions assigned
-    assert p1.positions == [(0, 0)]
-    assert p2.positions == [(0, 1)]
+    assert p1.positions == {(0, 0)}
+    assert p2.positions == {(0, 1)}
 
     # set expertise
     game.set_player_expertise(player_id=2, category=cat_b)
@@ -35,6 +35,8 @@ def test_board_and_positions_and_challenge():
     # winner (p2) should now own both cells and loser (p1) eliminated
     assert set(p2.positions) == {(0, 1), (0, 0)}
     assert p1.eliminated is True
+    assert p1.positions == set()
+    assert p1.primary_position() is None
     # winner inherits challenger's expertise
     assert p2.expertise is p1.expertise
 
@@ -52,3 +54,126 @@ def test_challenge_without_expertise_raises():
     game = Game(players=[p1, p2], nrows=1, ncols=2)
     with pytest.raises(ValueError):
         game.challenge(challenger_id=1, challenged_id=2)
+
+
+def test_get_player_at_row_major_and_out_of_range():
+    players = [Player(id=i + 1, name=f"P{i + 1}") for i in range(6)]
+    game = Game(players=players, nrows=2, ncols=3)
+
+    assert game.board.get_player_at(0, 0) == 1
+    assert game.board.get_player_at(1, 2) == 6
+    assert players[4].positions == {(1, 1)}
+    assert game.board.get_player_at(2, 0) is None
+    assert game.board.get_player_at(0, -1) is None
+
+
+def test_resolve_duel_transfers_mask_and_ends_game():
+    cat = Category(name="Math")
+    p1 = Player(id=1, name="Alice")
+    p2 = Player(id=2, name="Bob")
+    game = Game(players=[p1, p2], nrows=1, ncols=2)
+    assert (p1.mask, p2.mask) == (0b01, 0b10)
+    with pytest.raises(TypeError):
+        Player(id=3, name="Three", mask=0b11)
+
+    game.set_player_expertise(player_id=2, category=cat)
+    duel = game.challenge(challenger_id=1, challenged_id=2)
+    game.resolve_duel(duel, winner_id=1)
+
+    assert p1.mask == 0b11
+    assert p2.mask == 0
+    assert game.owner_counts == {1: 2, 2: 0}
+    assert game.over is True
+    assert game.winner_id == 1
+    assert game.start_turn() == 1
+
+
+def test_resolve_foreign_duel_raises():
+    cat = Category(name="Art")
+    p1 = Player(id=1, name="One")
+    p2 = Player(id=2, name="Two")
+    game = Game(players=[p1, p2], nrows=1, ncols=2)
+    game.set_player_expertise(player_id=2, category=cat)
+    game.challenge(challenger_id=1, challenged_id=2)
+
+    # structurally identical, but not created by this game
+    foreign = Duel(challenger=p1, challenged=p2, category=cat)
+    assert foreign != game.duel_history[-1]
+    assert foreign not in game.duel_history
+    with pytest.raises(ValueError):
+        game.resolve_duel(foreign, winner_id=1)
+
+
+def test_start_turn_prefers_single_cell_players():
+    cat = Category(name="Sport")
+    players = [Player(id=i + 1, name=f"P{i + 1}") for i in range(3)]
+    game = Game(players=players, nrows=1, ncols=3)
+    game.set_player_expertise(player_id=2, category=cat)
+    duel = game.challenge(challenger_id=1, challenged_id=2)
+    game.resolve_duel(duel, winner_id=1)
+
+    # player 1 now owns two cells and player 2 is out; only player 3 has one
+    for _ in range(10):
+        assert game.start_turn() == 3
+
+
+def test_non_sequential_player_ids_are_found():
+    cat = Category(name="Music")
+    p1 = Player(id=10, name="Ten")
+    p2 = Player(id=1, name="One")
+    game = Game(players=[p1, p2], nrows=1, ncols=2)
+    game.set_player_expertise(player_id=10, category=cat)
+
+    duel = game.challenge(challenger_id=1, challenged_id=10)
+    assert duel.challenger is p2
+    assert duel.challenged is p1
+    with pytest.raises(KeyError):
+        game.challenge(challenger_id=2, challenged_id=10)
+
+
+def test_start_turn_covers_remaining_players_after_eliminations():
+    cat = Category(name="Film")
+    players = [Player(id=i + 1, name=f"P{i + 1}") for i in range(4)]
+    game = Game(players=players, nrows=2, ncols=2)
+    for pid in (1, 2):
+        game.set_player_expertise(player_id=pid, category=cat)
+
+    game.resolve_duel(game.challenge(challenger_id=3, challenged_id=1), winner_id=3)
+    game.resolve_duel(game.challenge(challenger_id=4, challenged_id=2), winner_id=4)
+
+    # nobody owns a single cell any more, so any alive player may be picked
+    picks = {game.start_turn() for _ in range(50)}
+    assert picks == {3, 4}
+
+
+def test_category_is_frozen_and_hashable():
+    cat = Category(name="History")
+    assert {cat: 1}[Category(name="History")] == 1
+    with pytest.raises(AttributeError):
+        cat.name = "Geography"
+
+
+def test_beating_eliminated_player_keeps_winner_single_cell():
+    cat = Category(name="Poetry")
+    players = [Player(id=i + 1, name=f"P{i + 1}") for i in range(3)]
+    game = Game(players=players, nrows=1, ncols=3)
+    for pid in (1, 2, 3):
+        game.set_player_expertise(player_id=pid, category=cat)
+
+    game.resolve_duel(game.challenge(challenger_id=1, challenged_id=2), winner_id=1)
+    # player 2 is already out, so player 3 wins no cells and still owns one
+    game.resolve_duel(game.challenge(challenger_id=3, challenged_id=2), winner_id=3)
+
+    assert players[2].positions == {(0, 2)}
+    assert game._singles_list == [players[2]]
+    assert game._singles_index == {3: 0}
+    assert sorted(p.id for p in game._alive_list) == [1, 3]
+    for _ in range(20):
+        assert game.start_turn() == 3
+
+
+def test_set_expertise_unknown_id_raises_key_error():
+    p1 = Player(id=1, name="One")
+    game = Game(players=[p1], nrows=1, ncols=1)
+    with pytest.raises(KeyError):
+        game.set_player_expertise(player_id="1", category=Category(name="X"))
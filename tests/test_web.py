@@ -0,0 +1,89 @@
+import pytest
+
+from the_floor_game import web
+from the_floor_game.core import Game, Player
+
+
+@pytest.fixture
+def client():
+    # web.py keeps its state in module globals; reset it around each test
+    web.current_game = None
+    web.categories.clear()
+    web._touch_categories()
+    web._board_html_cache.clear()
+    yield web.app.test_client()
+    web.current_game = None
+    web.categories.clear()
+    web._touch_categories()
+    web._board_html_cache.clear()
+
+
+def _board(client) -> str:
+    resp = client.get("/board")
+    assert resp.status_code == 200
+    return resp.get_data(as_text=True)
+
+
+def test_board_page_changes_after_each_action(client):
+    client.post("/create_game", data={"nrows": "1", "ncols": "3", "categories": "History"})
+    cid = next(iter(web.categories))
+    page = _board(client)
+    # a repeat GET with no changes is served from the cache
+    assert _board(client) == page
+
+    client.post("/set_player", data={"player_id": "2", "name": "Zed", "category_id": str(cid)})
+    after_set = _board(client)
+    assert after_set != page
+    assert "Zed" in after_set
+
+    client.post("/challenge", data={"challenger_id": "1", "challenged_id": "2"})
+    after_challenge = _board(client)
+    assert after_challenge != after_set
+    assert "Resolve last duel" in after_challenge
+
+    client.post("/resolve_duel", data={"winner_id": "1"})
+    after_resolve = _board(client)
+    assert after_resolve != after_challenge
+    assert "Resolve last duel" not in after_resolve
+    assert "#1 • 2" in after_resolve
+
+    client.post("/start_turn")
+    after_turn = _board(client)
+    assert after_turn != after_resolve
+    assert "Current turn challenger" in after_turn
+
+    client.post("/add_category", data={"name": "Astronomy"})
+    after_category = _board(client)
+    assert after_category != after_turn
+    assert "Astronomy" in after_category
+
+
+def test_new_game_does_not_serve_previous_game_pages(client):
+    client.post("/create_game", data={"nrows": "1", "ncols": "2", "player_names": "Ann,Ben"})
+    first = _board(client)
+    assert "Ann" in first
+
+    client.post("/create_game", data={"nrows": "1", "ncols": "2", "player_names": "Cat,Dan"})
+    second = _board(client)
+    assert "Ann" not in second
+    assert "Cat" in second
+
+
+def test_board_renders_game_not_created_by_route(client):
+    web.current_game = Game(players=[Player(id=1, name="Solo")], nrows=1, ncols=1)
+    assert "Solo" in _board(client)
+
+
+def test_swapping_game_object_does_not_serve_cached_page(client):
+    client.post("/create_game", data={"nrows": "1", "ncols": "2", "player_names": "Ann,Ben"})
+    assert "Ann" in _board(client)
+
+    # same state version as the cached page, but a different game
+    game = Game(players=[Player(id=1, name="Zoe"), Player(id=2, name="Yan")], nrows=1, ncols=2)
+    game.mark_changed()
+    assert game.state_version == web.current_game.state_version
+    web.current_game = game
+
+    page = _board(client)
+    assert "Zoe" in page
+    assert "Ann" not in page
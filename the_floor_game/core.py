@@ -1,26 +1,30 @@
 from dataclasses import dataclass, field
-from typing import List, Optional, Tuple, Dict
+from typing import List, Optional, Set, Tuple, Dict
 import random
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Category:
-    """A knowledge category or expertise area."""
+    """A knowledge category or expertise area. Immutable and hashable."""
     name: str
     description: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Player:
     """Represents a player in the game.
 
     A player can own multiple board cells (positions) after winning duels.
+    ``mask`` mirrors ``positions`` as a bitmask over row-major cell indices.
+    It is not a constructor argument: only ``Board.place_players`` and
+    ``Game.resolve_duel`` may write it, keeping it in step with ``positions``.
     """
     id: int
     name: str
     expertise: Optional[Category] = None
-    positions: List[Tuple[int, int]] = field(default_factory=list)
+    positions: Set[Tuple[int, int]] = field(default_factory=set)
     eliminated: bool = False
+    mask: int = field(default=0, init=False, repr=False)
 
     def choose_expertise(self, category: Category) -> None:
         """Set the player's expertise/category."""
@@ -28,14 +32,15 @@ class Player:
 
     def primary_position(self) -> Optional[Tuple[int, int]]:
         """Return one representative position (or None)."""
-        return self.positions[0] if self.positions else None
+        return next(iter(self.positions), None)
 
 
-@dataclass
+@dataclass(eq=False, slots=True)
 class Duel:
     """Represents a duel between two players on a specific category.
 
-    The challenger duels on the challenged player's category.
+    The challenger duels on the challenged player's category. Duels compare
+    by identity: two duels between the same players are still distinct.
     """
     challenger: Player
     challenged: Player
@@ -72,15 +77,16 @@ class Board:
             raise ValueError("nrows and ncols must be positive")
         self.nrows = nrows
         self.ncols = ncols
-        # map (row,col) -> player id
-        self._grid: Dict[Tuple[int, int], Optional[int]] = {
-            (r, c): None for r in range(nrows) for c in range(ncols)
-        }
+        # flat row-major list of player ids; -1 marks an empty cell
+        self._grid: List[int] = [-1] * (nrows * ncols)
 
     @property
     def capacity(self) -> int:
         return self.nrows * self.ncols
 
+    def _idx(self, row: int, col: int) -> int:
+        return row * self.ncols + col
+
     def place_players(self, players: List[Player]) -> None:
         """Place players on the board in row-major order.
 
@@ -89,18 +95,31 @@ class Board:
         if len(players) != self.capacity:
             raise ValueError("players list length must equal board capacity")
 
-        it = iter(players)
-        for r in range(self.nrows):
-            for c in range(self.ncols):
-                player = next(it)
-                self._grid[(r, c)] = player.id
-                player.positions = [(r, c)]
+        grid, ncols = self._grid, self.ncols
+        for i, player in enumerate(players):
+            grid[i] = player.id
+            player.positions = {divmod(i, ncols)}
+            player.mask = 1 << i
 
     def get_player_position(self, player: Player) -> Optional[Tuple[int, int]]:
         return player.primary_position()
 
     def get_player_at(self, row: int, col: int) -> Optional[int]:
-        return self._grid.get((row, col))
+        if not (0 <= row < self.nrows and 0 <= col < self.ncols):
+            return None
+        pid = self._grid[self._idx(row, col)]
+        return pid if pid != -1 else None
+
+
+def _swap_remove(items: List[Player], index: Dict[int, int], pid: int) -> None:
+    """Remove the player with id ``pid`` in O(1) by moving the last item into its slot."""
+    i = index.pop(pid, None)
+    if i is None:
+        return
+    last = items.pop()
+    if i < len(items):
+        items[i] = last
+        index[last.id] = i
 
 
 class Game:
@@ -120,16 +139,38 @@ class Game:
         # place players
         self.board.place_players(players)
         self.duel_history = []
+        # ids of duels created by this game, for O(1) membership checks
+        self._duel_ids: Set[int] = set()
         self.over = False
         self.winner_id = None
+        # alive players, and alive players owning exactly one cell, each with
+        # an id -> list position index; maintained incrementally by resolve_duel
+        self._alive_list: List[Player] = list(players)
+        self._alive_index: Dict[int, int] = {p.id: i for i, p in enumerate(players)}
+        self._singles_list: List[Player] = list(players)
+        self._singles_index: Dict[int, int] = dict(self._alive_index)
+        # number of board cells owned by each player id
+        self.owner_counts: Dict[int, int] = {pid: 1 for pid in self.players}
+        # bumped on every state change so views can cache derived output
+        self._state_version = 0
         # id of player selected as the challenger for the current turn (if any)
         self.turn_challenger_id = None
 
+    @property
+    def state_version(self) -> int:
+        """Counter that increases whenever the game state changes."""
+        return self._state_version
+
+    def mark_changed(self) -> None:
+        """Record a state change, e.g. after editing a player directly."""
+        self._state_version += 1
+
     def set_player_expertise(self, player_id: int, category: Category) -> None:
         player = self.players.get(player_id)
         if not player:
             raise KeyError(f"player {player_id} not found")
         player.choose_expertise(category)
+        self.mark_changed()
 
     def challenge(self, challenger_id: int, challenged_id: int) -> Duel:
         """Create a Duel where challenger duels on the challenged's category.
@@ -141,13 +182,15 @@ class Game:
 
         challenger = self.players.get(challenger_id)
         challenged = self.players.get(challenged_id)
-        if not challenger or not challenged:
+        if challenger is None or challenged is None:
             raise KeyError("both challenger and challenged must be registered players")
         if not challenged.expertise:
             raise ValueError("challenged player must have an expertise/category set")
 
         duel = Duel(challenger=challenger, challenged=challenged, category=challenged.expertise)
         self.duel_history.append(duel)
+        self._duel_ids.add(id(duel))
+        self.mark_changed()
         return duel
 
     def resolve_duel(self, duel: Duel, winner_id: int) -> None:
@@ -157,10 +200,11 @@ class Game:
         eliminated (their positions cleared). If one player ends up owning all
         cells, the game is marked as over.
         """
-        if duel not in self.duel_history:
+        if id(duel) not in self._duel_ids:
             raise ValueError("duel not found in game history")
 
         duel.resolve(winner_id=winner_id)
+        self.mark_changed()
 
         # Determine winner and loser player objects
         if duel.winner_id == duel.challenger.id:
@@ -171,24 +215,33 @@ class Game:
             loser = duel.challenger
 
         # Transfer all loser positions to winner
-        for pos in list(loser.positions):
-            # update board grid
-            self.board._grid[pos] = winner.id
-            # add to winner positions
-            winner.positions.append(pos)
+        grid, ncols, wid = self.board._grid, self.board.ncols, winner.id
+        for r, c in loser.positions:
+            grid[r * ncols + c] = wid
+        winner.positions |= loser.positions
+        winner.mask |= loser.mask
 
         # Winner inherits the challenger's expertise/category
         winner.expertise = duel.challenger.expertise
 
         # clear loser
-        loser.positions = []
+        loser.positions = set()
+        loser.mask = 0
         loser.eliminated = True
+        self.owner_counts[winner.id] += self.owner_counts[loser.id]
+        self.owner_counts[loser.id] = 0
+        _swap_remove(self._alive_list, self._alive_index, loser.id)
+        _swap_remove(self._singles_list, self._singles_index, loser.id)
+        # beating an already-eliminated player gains nothing, so the winner
+        # only stops being a single-cell candidate once it owns several cells
+        if winner.mask & (winner.mask - 1):
+            _swap_remove(self._singles_list, self._singles_index, winner.id)
 
         # Check whether only one non-eliminated player remains and owns all cells
-        alive_players = [p for p in self.players.values() if not p.eliminated]
-        if len(alive_players) == 1 and len(alive_players[0].positions) == self.board.capacity:
+        full_mask = (1 << self.board.capacity) - 1
+        if len(self._alive_list) == 1 and winner.mask == full_mask:
             self.over = True
-            self.winner_id = alive_players[0].id
+            self.winner_id = winner.id
 
     def start_turn(self) -> Optional[int]:
         """Start a new turn by selecting a challenger according to rules:
@@ -198,16 +251,11 @@ class Game:
 
         Stores the selected player id in self.turn_challenger_id and returns it.
         """
-        alive_players = [p for p in self.players.values() if not p.eliminated]
-        if not alive_players:
+        self.mark_changed()
+        candidates = self._singles_list or self._alive_list
+        if not candidates:
             self.turn_challenger_id = None
             return None
 
-        ones = [p for p in alive_players if len(p.positions) == 1]
-        if ones:
-            chosen = random.choice(ones)
-        else:
-            chosen = random.choice(alive_players)
-
-        self.turn_challenger_id = chosen.id
+        self.turn_challenger_id = random.choice(candidates).id
         return self.turn_challenger_id
@@ -1,5 +1,8 @@
 import os
-from typing import Dict, Optional
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
 from flask import Flask, render_template, request, redirect, url_for
 
 from .core import Player, Category, Game
@@ -16,6 +19,15 @@ app = Flask(__name__, template_folder=TEMPLATES_DIR)
 categories: Dict[int, Category] = {}
 next_category_id = 1
 current_game: Optional[Game] = None
+# bumped whenever `categories` changes
+_categories_version = 0
+# materialized categories.items(), rebuilt lazily after a change
+_categories_cache: Optional[List[Tuple[int, Category]]] = None
+# rendered board pages keyed by (game id, game state version, categories
+# version); entries keep the game itself so a recycled id never matches
+_BOARD_CACHE_SIZE = 8
+_board_html_cache: "OrderedDict[Tuple[int, int, int], Tuple[Optional[Game], str]]" = OrderedDict()
+_board_html_lock = threading.Lock()
 
 
 def _get_next_category_id() -> int:
@@ -25,9 +37,25 @@ def _get_next_category_id() -> int:
     return cid
 
 
-def _color_for_id(pid: int) -> str:
+def _touch_categories() -> None:
+    global _categories_version, _categories_cache
+    _categories_version += 1
+    _categories_cache = None
+
+
+def _category_items() -> List[Tuple[int, Category]]:
+    global _categories_cache
+    if _categories_cache is None:
+        _categories_cache = list(categories.items())
+    return _categories_cache
+
+
+@lru_cache(maxsize=256)
+def _color_for_id(pid: int) -> Dict[str, str]:
     """Return a color dict for the player id with background, border and text.
 
+    Results are cached and shared between callers, so treat them as read-only.
+
     - background: pastel color
     - border: slightly darker for contrast
     - text: black or dark depending on background lightness
@@ -45,24 +73,31 @@ def _color_for_id(pid: int) -> str:
 @app.route("/", methods=["GET"])
 def index():
     """Setup page: collect board size and optional initial categories."""
-    cats = list(categories.items())
+    cats = _category_items()
     return render_template("setup.html", categories=cats, game=current_game)
 
 
 @app.route("/board", methods=["GET"])
 def board():
     global categories, current_game
-    cats = list(categories.items())
-    player_colors = {}
-    if current_game:
-        for pid in current_game.players.keys():
-            player_colors[pid] = _color_for_id(pid)
-    # compute owner counts for badges
-    owner_counts = {}
-    if current_game:
-        for pid, p in current_game.players.items():
-            owner_counts[pid] = len(p.positions)
-    return render_template("index.html", game=current_game, categories=cats, player_colors=player_colors, owner_counts=owner_counts)
+    game = current_game
+    key = (id(game), game.state_version if game else -1, _categories_version)
+    with _board_html_lock:
+        entry = _board_html_cache.get(key)
+        if entry is not None and entry[0] is game:
+            _board_html_cache.move_to_end(key)
+            return entry[1]
+    cats = _category_items()
+    # colors come from the memoized _color_for_id; counts are kept by the game
+    player_colors = {pid: _color_for_id(pid) for pid in game.players} if game else {}
+    owner_counts = game.owner_counts if game else {}
+    html = render_template("index.html", game=game, categories=cats, player_colors=player_colors, owner_counts=owner_counts)
+    with _board_html_lock:
+        _board_html_cache[key] = (game, html)
+        _board_html_cache.move_to_end(key)
+        if len(_board_html_cache) > _BOARD_CACHE_SIZE:
+            _board_html_cache.popitem(last=False)
+    return html
 
 
 @app.route("/start_turn", methods=["POST"])
@@ -90,6 +125,9 @@ def create_game():
     # create placeholder players with sequential ids
     players = [Player(id=i + 1, name=f"Player {i + 1}") for i in range(capacity)]
     current_game = Game(players=players, nrows=nrows, ncols=ncols)
+    # pages of the previous game can no longer be served; drop them early
+    with _board_html_lock:
+        _board_html_cache.clear()
 
     # optional initial categories (comma separated)
     cats_raw = request.form.get("categories", "").strip()
@@ -97,6 +135,7 @@ def create_game():
         for name in [c.strip() for c in cats_raw.split(",") if c.strip()]:
             cid = _get_next_category_id()
             categories[cid] = Category(name=name)
+        _touch_categories()
 
     # optional initial player names (comma separated)
     names_raw = request.form.get("player_names", "").strip()
@@ -109,6 +148,7 @@ def create_game():
     for i, player in enumerate(players):
         if i < len(names):
             player.name = names[i]
+    current_game.mark_changed()
 
     return redirect(url_for("board"))
 
@@ -122,6 +162,7 @@ def add_category():
         return "Category name required", 400
     cid = _get_next_category_id()
     categories[cid] = Category(name=name, description=desc)
+    _touch_categories()
     # If a game exists, show board; otherwise return to setup so user can
     # continue adding categories before creating the board.
     if current_game:
@@ -152,6 +193,7 @@ def set_player():
                 player.expertise = categories[cid]
         except ValueError:
             pass
+    current_game.mark_changed()
     # Allow forms to request returning to setup page
     next_page = request.form.get("next")
     if next_page == "setup":